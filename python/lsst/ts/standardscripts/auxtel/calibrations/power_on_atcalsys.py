@@ -25,7 +25,7 @@ import asyncio
 import time as time
 
 import yaml
-from lsst.ts import salobj
+from lsst.ts import salobj, utils
 from lsst.ts.idl.enums import ATWhiteLight
 
 
@@ -59,12 +59,19 @@ class PowerOnATCalSys(salobj.BaseScript):
         # Chiller config
         self.timeout_chiller_cool_down = 60 * 15
         self.chiller_temp_tolerance_relative = 0.2
+        self.chiller_telemetry_max_age = 5  # seconds
 
         # Shutter
         self.timeout_open_shutter = 60 * 3
 
     @classmethod
     def get_schema(cls):
+        # Cache the parsed schema per subclass so repeated calls do not
+        # re-parse the yaml.
+        schema_dict = cls.__dict__.get("_schema_dict")
+        if schema_dict is not None:
+            return schema_dict
+
         schema_yaml = """
             $schema: http://json-schema.org/draft-07/schema#
             $id: https://github.com/lsst-ts/ts_standardscripts/auxtel/calibrations/power_on_atcalsys.yaml
@@ -119,7 +126,8 @@ class PowerOnATCalSys(salobj.BaseScript):
 
             additionalProperties: false
         """
-        return yaml.safe_load(schema_yaml)
+        cls._schema_dict = yaml.safe_load(schema_yaml)
+        return cls._schema_dict
 
     async def configure(self, config):
         """Configure the script.
@@ -210,10 +218,33 @@ class PowerOnATCalSys(salobj.BaseScript):
             If the chiller doesn't reach self.chiller_temperature
             within tolerance in self.timeout_chiller_cool_down s."""
         start_chill_time = time.time()
+        is_first_reading = True
         while time.time() - start_chill_time < self.timeout_chiller_cool_down:
-            chiller_temps = await self.white_light_source.tel_chillerTemperatures.next(
-                flush=True, timeout=self.timeout_std
-            )
+            if is_first_reading:
+                # Check the most recent reading first; if the chiller is
+                # already running at the set temperature there is no need
+                # to wait for a fresh telemetry sample. Only trust that
+                # reading if it is recent and reflects the requested set
+                # point, so a stale sample from a previous session cannot
+                # skip the cool-down wait.
+                chiller_temps = (
+                    await self.white_light_source.tel_chillerTemperatures.aget(
+                        timeout=self.timeout_std
+                    )
+                )
+                is_first_reading = False
+                sample_age = utils.current_tai() - chiller_temps.private_sndStamp
+                if (
+                    sample_age > self.chiller_telemetry_max_age
+                    or chiller_temps.setTemperature != self.chiller_temperature
+                ):
+                    continue
+            else:
+                chiller_temps = (
+                    await self.white_light_source.tel_chillerTemperatures.next(
+                        flush=True, timeout=self.timeout_std
+                    )
+                )
             tel_chiller_temp = chiller_temps.supplyTemperature
             self.log.debug(
                 f"Chiller supply temperature: {tel_chiller_temp:0.1f} deg "
@@ -85,17 +85,16 @@ class PrepareForOnSky(salobj.BaseScript):
             await self.latiss.start_task
 
         if hasattr(config, "ignore"):
+            attcs_components = set(self.attcs.components_attr)
+            latiss_components = set(self.latiss.components_attr)
             for comp in config.ignore:
-                if (
-                    comp not in self.attcs.components_attr
-                    and comp not in self.latiss.components_attr
-                ):
+                if comp not in attcs_components and comp not in latiss_components:
                     self.log.warning(
                         f"Component {comp} not in CSC Group. "
                         f"Must be one of {self.attcs.components_attr} or "
                         f"{self.latiss.components_attr}. Ignoring."
                     )
-                elif comp in self.attcs.components_attr:
+                elif comp in attcs_components:
                     self.log.debug(f"Ignoring component {comp} from ATCS.")
                     setattr(self.attcs.check, comp, False)
                 else:
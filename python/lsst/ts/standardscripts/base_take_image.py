@@ -23,7 +23,7 @@ __all__ = ["BaseTakeImage"]
 
 import abc
 import asyncio
-import collections
+import collections.abc
 
 import astropy.units
 import numpy as np
@@ -55,6 +55,8 @@ class BaseTakeImage(salobj.BaseScript, metaclass=abc.ABCMeta):
 
         self.instrument_setup_time = 0.0
 
+        self.mean_exp_time = 0.0
+
     @property
     @abc.abstractmethod
     def camera(self):
@@ -188,10 +190,15 @@ class BaseTakeImage(salobj.BaseScript, metaclass=abc.ABCMeta):
             if nimages is None:
                 nimages = 1
             self.config.exp_times = [self.config.exp_times] * nimages
+        # Precompute the mean exposure time once, so set_metadata does not
+        # redo the reduction on every call.
+        self.mean_exp_time = np.asarray(
+            self.config.exp_times, dtype=np.float64
+        ).mean()
 
     def set_metadata(self, metadata):
         nimages = len(self.config.exp_times)
-        mean_exptime = np.mean(self.config.exp_times)
+        mean_exptime = self.mean_exp_time
         metadata.duration = (
             self.instrument_setup_time
             + self.config.slew_time
@@ -243,7 +250,7 @@ class BaseTakeImage(salobj.BaseScript, metaclass=abc.ABCMeta):
         await asyncio.gather(*setup_tasks)
         for i, exposure in enumerate(self.config.exp_times):
             self.log.debug(
-                f"Exposing image {i+1} of {nimages} with exp_time={exposure}s."
+                "Exposing image %d of %d with exp_time=%ss.", i + 1, nimages, exposure
             )
             await self.checkpoint(f"exposure {i+1} of {nimages}")
             await self.camera.take_imgtype(
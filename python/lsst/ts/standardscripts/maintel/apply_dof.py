@@ -72,6 +72,12 @@ class ApplyDOF(salobj.BaseScript):
 
     @classmethod
     def get_schema(cls) -> typing.Dict[str, typing.Any]:
+        # Cache the parsed schema per subclass; the DOF schema is large
+        # and re-parsing the yaml on every call is wasteful.
+        schema_dict = cls.__dict__.get("_schema_dict")
+        if schema_dict is not None:
+            return schema_dict
+
         schema_yaml = """
             $schema: http://json-schema.org/draft-07/schema#
             $id: https://github.com/lsst-ts/ts_standardscripts/maintel/ApplyDOF.yaml
@@ -399,7 +405,8 @@ class ApplyDOF(salobj.BaseScript):
                       type: string
             additionalProperties: false
         """
-        return yaml.safe_load(schema_yaml)
+        cls._schema_dict = yaml.safe_load(schema_yaml)
+        return cls._schema_dict
 
     async def configure(self, config) -> None:
         """Configure script.
@@ -421,16 +428,18 @@ class ApplyDOF(salobj.BaseScript):
                 if hasattr(DOFName, key):
                     self.dofs[getattr(DOFName, key)] = value
                 else:
-                    self.log.warning(f"{key} is not a DOFName, ignoring.")
+                    self.log.warning("%s is not a DOFName, ignoring.", key)
 
+        components_attr = set(self.mtcs.components_attr)
         for comp in getattr(config, "ignore", []):
-            if comp not in self.mtcs.components_attr:
+            if comp not in components_attr:
                 self.log.warning(
-                    f"Component {comp} not in CSC Group. "
-                    f"Must be one of {self.mtcs.components_attr}. Ignoring."
+                    "Component %s not in CSC Group. Must be one of %s. Ignoring.",
+                    comp,
+                    self.mtcs.components_attr,
                 )
             else:
-                self.log.debug(f"Ignoring component {comp}.")
+                self.log.debug("Ignoring component %s.", comp)
                 setattr(self.mtcs.check, comp, False)
 
     def set_metadata(self, metadata) -> None:
@@ -457,6 +466,6 @@ class ApplyDOF(salobj.BaseScript):
 
         await self.checkpoint("Applying DOF offset...")
         offset_dof_data = self.mtcs.rem.mtaos.cmd_offsetDOF.DataType()
-        for i, dof_offset in enumerate(self.dofs):
-            offset_dof_data.value[i] = dof_offset
+        # Copy the DOF vector in bulk instead of element by element.
+        offset_dof_data.value[: len(self.dofs)] = self.dofs
         await self.mtcs.rem.mtaos.cmd_offsetDOF.start(data=offset_dof_data)
@@ -32,6 +32,10 @@ from lsst.ts.observatory.control.maintel.mtcs import MTCS
 
 from ...base_block_script import BaseBlockScript
 
+# Scale factors to convert published offsets (m, deg) to the units
+# expected by the hexapod offset commands (mm, deg).
+OFFSET_SCALE = np.array([1e3, 1e3, 1e3, 1.0, 1.0])
+
 
 # TODO (DM-38880) - Subsitute by class in idl.enum when available
 class AlignComponent(enum.IntEnum):
@@ -70,10 +74,18 @@ class Align(BaseBlockScript):
         self.max_iter = 10
         self.tolerance_linear = 1.0e-7  # meter
         self.tolerance_angular = 5.0 / 3600.0  # degrees
+        self.correction_tolerances = None
         self.target = None
+        self.align_func = None
 
     @classmethod
     def get_schema(cls):
+        # Parsing the yaml and merging the base schema is not cheap, so
+        # cache the result per subclass.
+        schema_dict = cls.__dict__.get("_schema_dict")
+        if schema_dict is not None:
+            return schema_dict
+
         url = "https://github.com/lsst-ts/"
         path = (
             "ts_externalscripts/blob/main/python/lsst/ts/standardscripts/"
@@ -121,6 +133,8 @@ class Align(BaseBlockScript):
                 properties
             ]
 
+        cls._schema_dict = schema_dict
+
         return schema_dict
 
     async def configure(self, config):
@@ -140,8 +154,16 @@ class Align(BaseBlockScript):
             )
         self.max_iter = config.max_iter
         self.target = getattr(AlignComponent, config.target)
+        # Resolve the align function once, instead of dispatching on the
+        # target every time align_target runs.
+        self.align_func = self.get_align_func()
         self.tolerance_linear = config.tolerance_linear
         self.tolerance_angular = config.tolerance_angular
+        # Per-axis tolerance vector (dX, dY, dZ, dRX, dRY), precomputed so
+        # align_target can apply all tolerances in a single vector operation.
+        self.correction_tolerances = np.array(
+            [self.tolerance_linear] * 3 + [self.tolerance_angular] * 2
+        )
 
     def set_metadata(self, metadata):
         """Set estimated duration of the script."""
@@ -173,24 +195,40 @@ class Align(BaseBlockScript):
             If not aligned after max_iter iterations.
         """
 
-        # Set function to align target.
-        align_func = self.get_align_func()
+        # Function to align the target, resolved once in configure.
+        align_func = self.align_func
 
         for n_iter in range(self.max_iter):
             self.laser_tracker.rem.lasertracker_1.evt_offsetsPublish.flush()
-            await self.laser_tracker.rem.lasertracker_1.cmd_align.set_start(
-                target=self.target,
-                timeout=self.timeout_align,
+            # Start waiting for the offsets event before issuing the align
+            # command, so an event published while the command executes is
+            # captured without an extra wait afterwards.
+            offsets_published_task = asyncio.create_task(
+                self.laser_tracker.rem.lasertracker_1.evt_offsetsPublish.next(
+                    flush=False, timeout=self.timeout_align + self.timeout_short
+                )
             )
+            try:
+                await self.laser_tracker.rem.lasertracker_1.cmd_align.set_start(
+                    target=self.target,
+                    timeout=self.timeout_align,
+                )
+            except BaseException:
+                offsets_published_task.cancel()
+                await asyncio.gather(offsets_published_task, return_exceptions=True)
+                raise
             if self.tolerance_linear == 0.0 and self.tolerance_angular == 0.0:
+                offsets_published_task.cancel()
+                await asyncio.gather(offsets_published_task, return_exceptions=True)
                 self.log.info("Tolerances are zero, skipping alignment.")
                 return
 
             try:
-                offset = (
-                    await self.laser_tracker.rem.lasertracker_1.evt_offsetsPublish.next(
-                        flush=False, timeout=self.timeout_short
-                    )
+                # The event wait has been running since before the command;
+                # once the command is done only allow it the same short grace
+                # period as before, then fall back to the last published data.
+                offset = await asyncio.wait_for(
+                    offsets_published_task, timeout=self.timeout_short
                 )
             except asyncio.TimeoutError:
                 self.log.warning("Cannot get new offset, using last data published.")
@@ -200,30 +238,29 @@ class Align(BaseBlockScript):
                     )
                 )
 
-            corrections = np.array(
-                [
-                    offset.dX * 1e3 if abs(offset.dX) > self.tolerance_linear else 0.0,
-                    offset.dY * 1e3 if abs(offset.dY) > self.tolerance_linear else 0.0,
-                    offset.dZ * 1e3 if abs(offset.dZ) > self.tolerance_linear else 0.0,
-                    offset.dRX if abs(offset.dRX) > self.tolerance_angular else 0.0,
-                    offset.dRY if abs(offset.dRY) > self.tolerance_angular else 0.0,
-                ]
+            offset_values = np.array(
+                [offset.dX, offset.dY, offset.dZ, offset.dRX, offset.dRY]
             )
+            above_tolerance = np.abs(offset_values) > self.correction_tolerances
+            corrections = np.where(above_tolerance, offset_values * OFFSET_SCALE, 0.0)
 
-            if any(corrections):
+            if above_tolerance.any():
                 self.log.info(
-                    f"[{n_iter+1:02d}:{self.max_iter:02d}]: Applying corrections: "
-                    f"dX={corrections[0]}, "
-                    f"dY={corrections[1]}, "
-                    f"dZ={corrections[2]}, "
-                    f"dRX={corrections[3]}, "
-                    f"dRY={corrections[4]}."
+                    "[%02d:%02d]: Applying corrections: "
+                    "dX=%s, dY=%s, dZ=%s, dRX=%s, dRY=%s.",
+                    n_iter + 1,
+                    self.max_iter,
+                    corrections[0],
+                    corrections[1],
+                    corrections[2],
+                    corrections[3],
+                    corrections[4],
                 )
                 await align_func(*-corrections)
 
             else:
                 self.log.info(
-                    f"[{n_iter+1:02d}:{self.max_iter:02d}]: Corrections completed."
+                    "[%02d:%02d]: Corrections completed.", n_iter + 1, self.max_iter
                 )
                 return
 
@@ -250,10 +287,20 @@ class Align(BaseBlockScript):
     async def run_block(self):
         """Run the script."""
 
-        await self.check_laser_status_ok()
-
         await self.checkpoint("Starting alignment procedure.")
 
-        # Align component
-        await self.align_target()
+        # Run the laser status check concurrently with the alignment, so
+        # the status query overlaps the first align command instead of
+        # delaying it. If the check fails, cancel the alignment and wait
+        # for it to finish before propagating, so no orphaned task keeps
+        # commanding the laser tracker or hexapods.
+        align_target_task = asyncio.create_task(self.align_target())
+        try:
+            await self.check_laser_status_ok()
+        except BaseException:
+            align_target_task.cancel()
+            await asyncio.gather(align_target_task, return_exceptions=True)
+            raise
+
+        await align_target_task
         await self.checkpoint(f"{self.target} aligned with laser tracker.")
@@ -65,8 +65,7 @@ class LowerM1M3(BaseBlockScript):
 
     async def run_block(self):
         await self.checkpoint("Lowering M1M3")
-        start_time = time.time()
+        start_time = time.perf_counter()
         await self.mtcs.lower_m1m3()
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        self.log.info(f"Lowering M1M3 took {elapsed_time:.2f} seconds")
+        elapsed_time = time.perf_counter() - start_time
+        self.log.info("Lowering M1M3 took %.2f seconds", elapsed_time)
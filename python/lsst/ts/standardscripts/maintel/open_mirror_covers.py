@@ -82,8 +82,9 @@ class OpenMirrorCovers(salobj.BaseScript):
             await self.mtcs.start_task
 
         if hasattr(self.config, "ignore"):
+            components_attr = set(self.mtcs.components_attr)
             for comp in self.config.ignore:
-                if comp not in self.mtcs.components_attr:
+                if comp not in components_attr:
                     self.log.warning(
                         f"Component {comp} not in CSC Group. "
                         f"Must be one of {self.mtcs.components_attr}. Ignoring."
@@ -21,6 +21,10 @@
 
 __all__ = ["SetDOF"]
 
+import asyncio
+
+import numpy as np
+
 from .apply_dof import ApplyDOF
 
 STD_TIMEOUT = 30
@@ -44,14 +48,25 @@ class SetDOF(ApplyDOF):
 
     async def run(self) -> None:
         """Run script."""
-        # Assert feasibility
-        await self.assert_feasibility()
+        # Assert feasibility and fetch the current DOF state concurrently;
+        # the two queries are independent. Cancel the fetch if the
+        # assertion fails so no abandoned task is left behind.
+        current_dof_task = asyncio.create_task(
+            self.mtcs.rem.mtaos.evt_degreeOfFreedom.aget(timeout=STD_TIMEOUT)
+        )
+        try:
+            await self.assert_feasibility()
+        except BaseException:
+            current_dof_task.cancel()
+            await asyncio.gather(current_dof_task, return_exceptions=True)
+            raise
+        current_dof = await current_dof_task
 
         await self.checkpoint("Setting DOF...")
-        current_dof = await self.mtcs.rem.mtaos.evt_degreeOfFreedom.aget(
-            timeout=STD_TIMEOUT
-        )
         dof_data = self.mtcs.rem.mtaos.cmd_offsetDOF.DataType()
-        for i, dof_absolute in enumerate(self.dofs):
-            dof_data.value[i] = dof_absolute - current_dof.aggregatedDoF[i]
+        # Compute the offset from the absolute position in one vectorized
+        # operation and assign it in bulk instead of element by element.
+        dof_data.value[: len(self.dofs)] = np.subtract(
+            self.dofs, current_dof.aggregatedDoF[: len(self.dofs)]
+        )
         await self.mtcs.rem.mtaos.cmd_offsetDOF.start(data=dof_data)
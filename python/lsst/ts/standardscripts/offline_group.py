@@ -71,6 +71,12 @@ class OfflineGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
 
     @classmethod
     def get_schema(cls):
+        # Cache the parsed schema per subclass; the yaml is rebuilt from
+        # an f-string and re-parsed on every call otherwise.
+        schema_dict = cls.__dict__.get("_schema_dict")
+        if schema_dict is not None:
+            return schema_dict
+
         schema_yaml = f"""
             $schema: http://json-schema.org/draft-07/schema#
             $id: https://github.com/lsst-ts/ts_standardscripts/offline_group.yaml
@@ -89,7 +95,8 @@ class OfflineGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
                         type: string
             additionalProperties: false
         """
-        return yaml.safe_load(schema_yaml)
+        cls._schema_dict = yaml.safe_load(schema_yaml)
+        return cls._schema_dict
 
     async def configure(self, config):
         self.config = config
@@ -99,11 +106,13 @@ class OfflineGroup(salobj.BaseScript, metaclass=abc.ABCMeta):
 
     async def run(self):
         if hasattr(self.config, "ignore"):
+            components = self.components()
+            components_set = set(components)
             for comp in self.config.ignore:
-                if comp not in self.components():
+                if comp not in components_set:
                     self.log.warning(
                         f"Component {comp} not in CSC Group. "
-                        f"Must be one of {self.components()}. Ignoring."
+                        f"Must be one of {components}. Ignoring."
                     )
                 else:
                     self.log.debug(f"Ignoring {comp}.")
@@ -29,12 +29,12 @@ __all__ = [
 
 import asyncio
 import collections.abc
+import functools
 import os
 import pathlib
 import re
 import warnings
 
-import numpy as np
 from lsst.ts import salobj
 from lsst.ts.salobj import name_to_name_index as salobj_name_to_name_index
 from lsst.ts.utils import astropy_time_from_tai_unix
@@ -45,7 +45,10 @@ S3_INSTANCES = dict(
     summit="cp",
 )
 
+NAME_REGEX = re.compile(r"(?P<name>[a-zA-Z_-][a-zA-Z0-9_-]*)(:(?P<index>\d+|\*))?$")
 
+
+@functools.lru_cache
 def get_scripts_dir():
     """Get the absolute path to the scripts directory.
 
@@ -58,27 +61,42 @@ def get_scripts_dir():
     return pathlib.Path(__file__).resolve().parent / "data" / "scripts"
 
 
+_mock_s3_bucket: salobj.AsyncS3Bucket | None = None
+
+
 def get_s3_bucket() -> salobj.AsyncS3Bucket:
     """Generate an s3 bucket object.
 
     The method will try to determine the s3 instance from the LSST_SITE
     environment variable. If it can't it will use "mock" as the instance
     value and will also mock the s3 bucket. This is useful for unit testing.
+
+    The mocked bucket is created once and reused on subsequent calls, so
+    repeated callers do not pay for constructing (and re-mocking) a new
+    bucket every time.
     """
+    global _mock_s3_bucket
 
     site = os.environ.get("LSST_SITE")
     do_mock = site not in S3_INSTANCES
+
+    if do_mock and _mock_s3_bucket is not None:
+        return _mock_s3_bucket
+
     s3instance = S3_INSTANCES.get(site, "mock")
 
     s3bucket_name = salobj.AsyncS3Bucket.make_bucket_name(
         s3instance=s3instance,
     )
 
-    return salobj.AsyncS3Bucket(
+    s3bucket = salobj.AsyncS3Bucket(
         name=s3bucket_name,
         domock=do_mock,
         create=do_mock,
     )
+    if do_mock:
+        _mock_s3_bucket = s3bucket
+    return s3bucket
 
 
 def format_as_list(value, recurrences):
@@ -138,6 +156,14 @@ def format_as_list(value, recurrences):
     return value_as_list
 
 
+def _is_scalar(value):
+    """Return True if ``value`` is a scalar for formatting purposes.
+
+    Strings count as scalars, matching the convention in `format_as_list`.
+    """
+    return isinstance(value, str) or not isinstance(value, collections.abc.Iterable)
+
+
 def format_grid(
     axis1: float | list[float], axis2: float | list[float]
 ) -> tuple[list[float], list[float]]:
@@ -171,11 +197,11 @@ def format_grid(
     RuntimeError
         If both inputs are lists of different lengths.
     """
-    if np.isscalar(axis1) and np.isscalar(axis2):
+    if _is_scalar(axis1) and _is_scalar(axis2):
         return [axis1], [axis2]
-    elif np.isscalar(axis1):
+    elif _is_scalar(axis1):
         return format_as_list(axis1, len(axis2)), axis2
-    elif np.isscalar(axis2):
+    elif _is_scalar(axis2):
         return axis1, format_as_list(axis2, len(axis1))
     else:
         if len(axis1) != len(axis2):
@@ -199,9 +225,8 @@ def get_topic_time_utc(topic):
         Value of salobj.BaseMsgType.private_sndStamp in UTC str time.
     """
 
-    topic_time = astropy_time_from_tai_unix(topic.private_sndStamp)
-    topic_time.format = "iso"
-    topic_time_utc = topic_time.utc
+    topic_time_utc = astropy_time_from_tai_unix(topic.private_sndStamp).utc
+    topic_time_utc.format = "iso"
     return topic_time_utc
 
 
@@ -236,18 +261,23 @@ async def find_running_instances(
         # Flush old heartbeats to avoid historical data.
         remote.evt_heartbeat.flush()
 
-        while all([value < min_heartbeat for value in heartbeats.values()]):
+        # Drain heartbeats until one index accumulates min_heartbeat beats
+        # or the topic goes quiet. Only the index just updated can newly
+        # reach the threshold, so check it directly instead of rescanning
+        # every entry after each message.
+        while True:
             try:
                 hb = await remote.evt_heartbeat.next(timeout=hb_timeout, flush=False)
-                sal_index = hb.salIndex if hasattr(hb, "salIndex") else 0
-
-                if sal_index not in heartbeats:
-                    heartbeats[sal_index] = 1
-                else:
-                    heartbeats[sal_index] += 1
             except asyncio.TimeoutError:
                 break
 
+            sal_index = hb.salIndex if hasattr(hb, "salIndex") else 0
+
+            heartbeats[sal_index] = heartbeats.get(sal_index, 0) + 1
+
+            if heartbeats[sal_index] >= min_heartbeat:
+                break
+
         indices = list(heartbeats.keys())
 
     return component, indices
@@ -280,8 +310,6 @@ def name_to_name_index(name: str) -> tuple[str, int]:
         stacklevel=2,
     )
 
-    NAME_REGEX = re.compile(r"(?P<name>[a-zA-Z_-][a-zA-Z0-9_-]*)(:(?P<index>\d+|\*))?$")
-
     try:
         return salobj_name_to_name_index(name)
     except ValueError:
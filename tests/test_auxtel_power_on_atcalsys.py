@@ -256,6 +256,81 @@ class TestPowerOnATCalSys(
             assert self.lamp_state.basicState == ATWhiteLight.LampBasicState.ON
             assert self.shutter_status.shutterState == ATWhiteLight.ShutterState.OPEN
 
+    def make_chiller_temperatures(self, supply_temperature, set_temperature=None, age=0):
+        """Make a mock chillerTemperatures telemetry sample.
+
+        By default the sample reports the configured set temperature
+        and was published just now.
+        """
+        if set_temperature is None:
+            set_temperature = self.script.chiller_temperature
+        return types.SimpleNamespace(
+            setTemperature=set_temperature,
+            supplyTemperature=supply_temperature,
+            private_sndStamp=utils.current_tai() - age,
+        )
+
+    async def test_wait_for_chiller_temp_fresh_sample_skips_wait(self):
+        async with self.make_script():
+            await self.configure_script()
+
+            # Restore the real method; configure_mocks replaces it.
+            del self.script.wait_for_chiller_temp_within_tolerance
+
+            chiller_temperatures = self.script.white_light_source.tel_chillerTemperatures
+            chiller_temperatures.aget.return_value = self.make_chiller_temperatures(
+                supply_temperature=self.script.chiller_temperature
+            )
+
+            await self.script.wait_for_chiller_temp_within_tolerance()
+
+            # A fresh sample at the set point must not trigger a
+            # flush-and-wait for new telemetry.
+            chiller_temperatures.aget.assert_awaited_once()
+            chiller_temperatures.next.assert_not_awaited()
+
+    async def test_wait_for_chiller_temp_stale_sample_waits(self):
+        async with self.make_script():
+            await self.configure_script()
+
+            del self.script.wait_for_chiller_temp_within_tolerance
+
+            chiller_temperatures = self.script.white_light_source.tel_chillerTemperatures
+            chiller_temperatures.aget.return_value = self.make_chiller_temperatures(
+                supply_temperature=self.script.chiller_temperature,
+                age=self.script.chiller_telemetry_max_age + 1,
+            )
+            chiller_temperatures.next.return_value = self.make_chiller_temperatures(
+                supply_temperature=self.script.chiller_temperature
+            )
+
+            await self.script.wait_for_chiller_temp_within_tolerance()
+
+            # A stale cached sample must fall through to the normal
+            # wait for fresh telemetry.
+            chiller_temperatures.next.assert_awaited_once()
+
+    async def test_wait_for_chiller_temp_set_point_mismatch_waits(self):
+        async with self.make_script():
+            await self.configure_script()
+
+            del self.script.wait_for_chiller_temp_within_tolerance
+
+            chiller_temperatures = self.script.white_light_source.tel_chillerTemperatures
+            # Fresh sample, but from a previous session with a
+            # different set point.
+            chiller_temperatures.aget.return_value = self.make_chiller_temperatures(
+                supply_temperature=self.script.chiller_temperature + 5,
+                set_temperature=self.script.chiller_temperature + 5,
+            )
+            chiller_temperatures.next.return_value = self.make_chiller_temperatures(
+                supply_temperature=self.script.chiller_temperature
+            )
+
+            await self.script.wait_for_chiller_temp_within_tolerance()
+
+            chiller_temperatures.next.assert_awaited_once()
+
     async def test_executable(self):
         scripts_dir = standardscripts.get_scripts_dir()
         script_path = scripts_dir / "auxtel" / "calibrations" / "power_on_atcalsys.py"
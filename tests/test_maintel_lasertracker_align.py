@@ -26,6 +26,7 @@ import unittest
 
 from lsst.ts import standardscripts
 from lsst.ts.idl.enums.LaserTracker import LaserStatus
+from lsst.ts.idl.enums.Script import ScriptState
 from lsst.ts.observatory.control.maintel.mtcs import MTCS, MTCSUsages
 from lsst.ts.observatory.control.remote_group import RemoteGroup, Usages
 from lsst.ts.salobj import State
@@ -141,6 +142,23 @@ class TestAlign(standardscripts.BaseScriptTestCase, unittest.IsolatedAsyncioTest
 
             assert self.state_0 == [0, 0, 0, 0, 0]
 
+    async def test_run_fails_when_laser_not_on(self):
+        async with self.make_script():
+            await self.configure_script(
+                max_iter=10,
+                target="M2",
+                tolerance_angular=5.0 / 3600.0,
+            )
+
+            self.laser_status = types.SimpleNamespace(status=LaserStatus.OFF)
+
+            await self.run_script(expected_final_state=ScriptState.FAILED)
+
+            self.assertEqual(self.script.state.state, ScriptState.FAILED)
+            # The alignment must have been cancelled before any
+            # correction was applied.
+            assert self.state_0 == [1, 1, 1, 1, 1]
+
     async def test_executable(self):
         scripts_dir = standardscripts.get_scripts_dir()
         script_path = scripts_dir / "maintel" / "laser_tracker" / "align.py"